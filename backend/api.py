@@ -4,27 +4,86 @@ from __future__ import annotations
 
 import csv
 import io
+import threading
 from typing import Dict, Any
 
+import numpy as np
+import orjson
 import pandas as pd
 from flask import Flask, jsonify, request, Response
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 
 from .models import Bankroll, Session
 from .main import seed_example_data
 from .storage import load_bankroll, save_bankroll
 
+try:
+    # Optional: numba-backed groupby kernels for the stats endpoints.
+    import numba  # noqa: F401
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+_NUMBA_ENGINE_KWARGS = {"nopython": True, "nogil": True}
+
+# Route pandas arithmetic/reductions through the numexpr and bottleneck
+# accelerators when installed (pandas only auto-enables numexpr past ~10k
+# rows; these are no-ops if the libraries are absent).
+pd.set_option("compute.use_numexpr", True)
+pd.set_option("compute.use_bottleneck", True)
+
+class ORJSONProvider(JSONProvider):
+    """
+    orjson-backed JSON provider: C-speed serialization that also handles
+    numpy scalars directly, so jsonify stays the same at every call site.
+    """
+
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=self._OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 
+if _HAS_NUMBA:
+    # Warm the numba groupby kernel at import so the first stats request
+    # doesn't pay the JIT compilation cost.
+    pd.Series([0.0, 1.0]).groupby(np.array([0, 1])).mean(
+        engine="numba", engine_kwargs=_NUMBA_ENGINE_KWARGS
+    )
+
 # -----------------------------------------------------------
-# Initialise bankroll (load from disk or seed demo data)
+# Bankroll access (lazy: load from disk or seed on first request)
 # -----------------------------------------------------------
 
-bankroll: Bankroll | None = load_bankroll()
-if bankroll is None:
-    bankroll = seed_example_data()
-    save_bankroll(bankroll)
+_bankroll: Bankroll | None = None
+_bankroll_lock = threading.Lock()
+
+
+def get_bankroll() -> Bankroll:
+    """
+    Return the process-wide Bankroll, loading it from disk (or seeding demo
+    data) on first use. Deferring this out of import time keeps worker
+    startup fast and lets gunicorn preload/fork without a serial disk read.
+    """
+    global _bankroll
+    if _bankroll is None:
+        with _bankroll_lock:
+            if _bankroll is None:
+                roll = load_bankroll()
+                if roll is None:
+                    roll = seed_example_data()
+                    save_bankroll(roll)
+                _bankroll = roll
+    return _bankroll
 
 
 # -----------------------------------------------------------
@@ -36,7 +95,7 @@ def session_to_json(s: Session) -> Dict[str, Any]:
     Serialize a Session object to a flat dict for JSON responses.
     """
     return {
-        "date": s.date.isoformat() if s.date else None,
+        "date": s.date_iso,
         "game": s.game,
         "buy_in": s.buy_in,
         "cash_out": s.cash_out,
@@ -46,38 +105,178 @@ def session_to_json(s: Session) -> Dict[str, Any]:
         "location": s.location,
         "notes": s.notes,
         # extended fields
-        "bullets": getattr(s, "bullets", None),
-        "tag": getattr(s, "tag", None),
-        "format": getattr(s, "format", None),
-        "stake": getattr(s, "stake", None),
+        "bullets": s.bullets,
+        "tag": s.tag,
+        "format": s.format,
+        "stake": s.stake,
     }
 
 
+# Cached DataFrame of all sessions. The stats endpoints are read-heavy, so we
+# only rebuild the frame when the bankroll's dirty bit is set (add_session
+# sets it itself; DELETE/PUT call bankroll.mark_dirty()).
+_df_cache: pd.DataFrame | None = None
+
+# Cached serialized session list for GET /api/sessions. POST appends to it
+# in place; DELETE/PUT drop it so the next GET rebuilds.
+_sessions_json_cache: list | None = None
+
+# Session-length buckets for /api/stats/session_length.
+_LENGTH_BINS = [0, 2, 3, 4, 999]
+_LENGTH_LABELS = ["0–2h", "2–3h", "3–4h", "4h+"]
+
+
 def sessions_to_dataframe() -> pd.DataFrame:
     """
     Convert in-memory sessions to a pandas DataFrame for analysis.
+
+    The result is cached and reused until sessions change; callers must not
+    mutate the returned frame (copy first if you need to add columns).
     """
-    rows = []
+    global _df_cache
+
+    bankroll = get_bankroll()
+    if _df_cache is not None and not bankroll._df_dirty:
+        return _df_cache
+
+    n = len(bankroll.sessions)
+    if n == 0:
+        _df_cache = pd.DataFrame()
+        bankroll._df_dirty = False
+        return _df_cache
+
+    # Numeric columns come straight from the bankroll's SoA arrays (zero
+    # copy); only the string columns still need a Python gather pass.
+    cols = bankroll.numeric_columns()
+    game = []
+    stake = []
+    fmt = []
+    location = []
+    tag = []
+    date = []
+
     for s in bankroll.sessions:
-        rows.append(
-            {
-                "game": s.game,
-                "stake": getattr(s, "stake", None),
-                "format": getattr(s, "format", None),
-                "location": s.location,
-                "tag": getattr(s, "tag", None),
-                "buy_in": s.buy_in,
-                "cash_out": s.cash_out,
-                "profit": s.profit,
-                "hours_played": s.hours_played,
-                "hourly_rate": s.hourly_rate,
-                "bullets": getattr(s, "bullets", 1),
-                "date": s.date.isoformat() if s.date else None,
-            }
+        game.append(s.game)
+        stake.append(s.stake)
+        fmt.append(s.format)
+        location.append(s.location)
+        tag.append(s.tag)
+        date.append(s.date_iso)
+
+    _df_cache = pd.DataFrame(
+        {
+            "game": game,
+            "stake": stake,
+            "format": fmt,
+            "location": location,
+            "tag": tag,
+            "buy_in": cols["buy_in"],
+            "cash_out": cols["cash_out"],
+            "profit": cols["profit"],
+            "hours_played": cols["hours_played"],
+            "hourly_rate": cols["hourly_rate"],
+            "bullets": cols["bullets"],
+            "date": date,
+        },
+        copy=False,
+    )
+    # Bin once here rather than on every request; the ordered Categorical
+    # also gives groupby the fast integer-coded path.
+    _df_cache["length_bucket"] = pd.cut(
+        _df_cache["hours_played"],
+        bins=_LENGTH_BINS,
+        labels=_LENGTH_LABELS,
+        right=False,
+    )
+    bankroll._df_dirty = False
+    return _df_cache
+
+
+def sessions_json() -> list:
+    """Serialized session list, rebuilt only after a delete/update."""
+    global _sessions_json_cache
+    if _sessions_json_cache is None:
+        _sessions_json_cache = [session_to_json(s) for s in get_bankroll().sessions]
+    return _sessions_json_cache
+
+
+def group_mean(grouped) -> pd.Series:
+    """
+    Mean per group, routed through numba's JIT kernel when available
+    (falls back to the default Cython path otherwise).
+    """
+    if _HAS_NUMBA:
+        return grouped.mean(engine="numba", engine_kwargs=_NUMBA_ENGINE_KWARGS)
+    return grouped.mean()
+
+
+if _HAS_NUMBA:
+    from numba import njit
+
+    @njit(cache=True)
+    def _grouped_sums(profit, hours, codes, n_groups):
+        """Sum profit/hours and count sessions per category code."""
+        sum_profit = np.zeros(n_groups, dtype=np.float64)
+        sum_hours = np.zeros(n_groups, dtype=np.float64)
+        counts = np.zeros(n_groups, dtype=np.int64)
+        for i in range(profit.size):
+            c = codes[i]
+            sum_profit[c] += profit[i]
+            sum_hours[c] += hours[i]
+            counts[c] += 1
+        return sum_profit, sum_hours, counts
+
+    # Warm-compile at import (cache=True keeps it across restarts too).
+    _grouped_sums(
+        np.zeros(1, dtype=np.float64),
+        np.zeros(1, dtype=np.float64),
+        np.zeros(1, dtype=np.int64),
+        1,
+    )
+
+
+def group_breakdown(df: pd.DataFrame, column: str) -> Dict[str, Dict[str, Any]]:
+    """Per-group sessions/profit/hours/hourly, keyed by column value."""
+    keys = df[column].fillna("Unknown")
+    keys = keys.mask(keys == "", "Unknown")
+
+    out: Dict[str, Dict[str, Any]] = {}
+
+    if _HAS_NUMBA:
+        # Factor the keys to int codes and run the compiled reduction.
+        cat = pd.Categorical(keys)
+        sum_profit, sum_hours, counts = _grouped_sums(
+            df["profit"].to_numpy(dtype=np.float64),
+            df["hours_played"].fillna(0.0).to_numpy(dtype=np.float64),
+            cat.codes.astype(np.int64),
+            len(cat.categories),
         )
-    if not rows:
-        return pd.DataFrame()
-    return pd.DataFrame(rows)
+        for i, key in enumerate(cat.categories):
+            hrs = float(sum_hours[i])
+            tp = float(sum_profit[i])
+            out[str(key)] = {
+                "sessions": int(counts[i]),
+                "total_profit": tp,
+                "total_hours": hrs,
+                "hourly": tp / hrs if hrs > 0 else None,
+            }
+        return out
+
+    grouped = df.groupby(keys).agg(
+        sessions=("profit", "size"),
+        total_profit=("profit", "sum"),
+        total_hours=("hours_played", "sum"),
+    )
+    for key, row in grouped.to_dict(orient="index").items():
+        hrs = float(row["total_hours"])
+        tp = float(row["total_profit"])
+        out[str(key)] = {
+            "sessions": int(row["sessions"]),
+            "total_profit": tp,
+            "total_hours": hrs,
+            "hourly": tp / hrs if hrs > 0 else None,
+        }
+    return out
 
 
 # -----------------------------------------------------------
@@ -87,7 +286,7 @@ def sessions_to_dataframe() -> pd.DataFrame:
 @app.route("/api/summary", methods=["GET"])
 def api_summary():
     """Return bankroll.summary() as an array of lines for the UI."""
-    text = bankroll.summary()
+    text = get_bankroll().summary()
     if isinstance(text, str):
         lines = text.split("\n")
     else:
@@ -98,7 +297,7 @@ def api_summary():
 @app.route("/api/history", methods=["GET"])
 def api_history():
     """Return bankroll history for the graph."""
-    history = bankroll.bankroll_history()
+    history = get_bankroll().bankroll_history()
     labels = [f"Session {i}" for i in range(1, len(history) + 1)]
     return jsonify({"labels": labels, "data": history})
 
@@ -109,8 +308,10 @@ def api_sessions():
     GET: return all sessions.
     POST: create a new session.
     """
+    bankroll = get_bankroll()
+
     if request.method == "GET":
-        return jsonify({"sessions": [session_to_json(s) for s in bankroll.sessions]})
+        return jsonify({"sessions": sessions_json()})
 
     # POST – create
     data = request.get_json() or {}
@@ -157,7 +358,11 @@ def api_sessions():
     bankroll.add_session(session)
     save_bankroll(bankroll)
 
-    return jsonify({"ok": True, "session": session_to_json(session)}), 201
+    session_json = session_to_json(session)
+    if _sessions_json_cache is not None:
+        _sessions_json_cache.append(session_json)
+
+    return jsonify({"ok": True, "session": session_json}), 201
 
 
 @app.route("/api/sessions/<int:index>", methods=["DELETE", "PUT"])
@@ -167,11 +372,17 @@ def api_session_modify(index: int):
     PUT: update session at index with payload fields.
     Index is based on the in-memory list order (same as frontend).
     """
+    global _sessions_json_cache
+
+    bankroll = get_bankroll()
     if index < 0 or index >= len(bankroll.sessions):
         return jsonify({"error": "Invalid index"}), 400
 
+    _sessions_json_cache = None
+
     if request.method == "DELETE":
         del bankroll.sessions[index]
+        bankroll.mark_dirty()
         save_bankroll(bankroll)
         return jsonify({"ok": True})
 
@@ -219,14 +430,17 @@ def api_session_modify(index: int):
     s.cash_out = maybe_float("cash_out", old_cash_out)
     s.hours_played = maybe_float("hours_played", old_hours)
 
-    # Recompute profit / hourly if your Session model doesn't do it automatically
-    # (If your Session has properties for these, this is harmless.)
+    # profit/hourly_rate are plain attributes computed at construction, so
+    # they must be recomputed after the inputs change.
     if s.buy_in is not None and s.cash_out is not None:
-        try:
-            s.profit = s.cash_out - s.buy_in  # will be ignored if profit is @property without setter
-        except AttributeError:
-            # profit is probably a @property; ignore, Bankroll / Session already handle it
-            pass
+        s.profit = s.cash_out - s.buy_in
+    s.hourly_rate = (
+        s.profit / s.hours_played
+        if s.hours_played and s.hours_played > 0
+        else None
+    )
+
+    bankroll.mark_dirty()
 
     try:
         save_bankroll(bankroll)
@@ -245,57 +459,39 @@ def api_stats_advanced():
     """
     Backend-computed aggregates for the Stats page.
     """
-    sessions = bankroll.sessions
-    total_sessions = len(sessions)
-    total_profit = sum(s.profit for s in sessions)
-    total_hours = sum((s.hours_played or 0.0) for s in sessions)
-    hourly = total_profit / total_hours if total_hours > 0 else None
+    df = sessions_to_dataframe()
+    total_sessions = int(len(df))
 
-    # By location
-    by_location: Dict[str, Dict[str, Any]] = {}
-    for s in sessions:
-        loc = s.location or "Unknown"
-        info = by_location.setdefault(
-            loc, {"sessions": 0, "total_profit": 0.0, "total_hours": 0.0}
-        )
-        info["sessions"] += 1
-        info["total_profit"] += s.profit
-        info["total_hours"] += s.hours_played or 0.0
-
-    for loc, info in by_location.items():
-        hrs = info["total_hours"]
-        info["hourly"] = info["total_profit"] / hrs if hrs > 0 else None
-
-    # By game
-    by_game: Dict[str, Dict[str, Any]] = {}
-    for s in sessions:
-        g = s.game or "Unknown"
-        info = by_game.setdefault(
-            g, {"sessions": 0, "total_profit": 0.0, "total_hours": 0.0}
+    if total_sessions == 0:
+        return jsonify(
+            {
+                "total_sessions": 0,
+                "total_profit": 0.0,
+                "total_hours": 0.0,
+                "hourly": None,
+                "by_location": {},
+                "by_game": {},
+                "variance": None,
+                "stdev": None,
+                "total_bullets": 0,
+            }
         )
-        info["sessions"] += 1
-        info["total_profit"] += s.profit
-        info["total_hours"] += s.hours_played or 0.0
 
-    for g, info in by_game.items():
-        hrs = info["total_hours"]
-        info["hourly"] = info["total_profit"] / hrs if hrs > 0 else None
+    total_profit = float(df["profit"].sum())
+    total_hours = float(df["hours_played"].fillna(0.0).sum())
+    hourly = total_profit / total_hours if total_hours > 0 else None
+
+    by_location = group_breakdown(df, "location")
+    by_game = group_breakdown(df, "game")
 
-    # Profit variance / stdev
-    profits = [s.profit for s in sessions]
+    # Profit variance / stdev (sample variance, ddof=1)
     variance = None
     stdev = None
-    if len(profits) > 1 and total_sessions > 1:
-        mean = total_profit / total_sessions
-        variance = sum((p - mean) ** 2 for p in profits) / (len(profits) - 1)
+    if total_sessions > 1:
+        variance = float(df["profit"].var(ddof=1))
         stdev = variance ** 0.5
 
-    # Bullets
-    total_bullets = 0
-    for s in sessions:
-        b = getattr(s, "bullets", None)
-        if isinstance(b, (int, float)):
-            total_bullets += int(b)
+    total_bullets = int(df["bullets"].fillna(0).sum())
 
     return jsonify(
         {
@@ -326,18 +522,17 @@ def stats_tags():
     if sub.empty:
         return jsonify({"tags": {}})
 
-    grouped = (
-        sub.groupby("tag")["hourly_rate"]
-        .agg(count="count", mean_hourly="mean")
-        .sort_values("mean_hourly", ascending=False)
-    )
+    gb = sub.groupby("tag")["hourly_rate"]
+    grouped = gb.size().to_frame("count")
+    grouped["mean_hourly"] = group_mean(gb)
+    grouped = grouped.sort_values("mean_hourly", ascending=False)
 
     tags = {
         str(tag): {
             "count": int(row["count"]),
             "mean_hourly": float(row["mean_hourly"]),
         }
-        for tag, row in grouped.iterrows()
+        for tag, row in grouped.to_dict(orient="index").items()
     }
 
     return jsonify({"tags": tags})
@@ -350,29 +545,27 @@ def stats_session_length():
     Returns: { "buckets": { label: { count, mean_profit, total_profit } } }
     """
     df = sessions_to_dataframe()
-    if df.empty or "hours_played" not in df or "profit" not in df:
+    if df.empty or "length_bucket" not in df or "profit" not in df:
         return jsonify({"buckets": {}})
 
-    sub = df.dropna(subset=["hours_played", "profit"]).copy()
+    sub = df.dropna(subset=["length_bucket", "profit"])
     if sub.empty:
         return jsonify({"buckets": {}})
 
-    bins = [0, 2, 3, 4, 999]
-    labels = ["0–2h", "2–3h", "3–4h", "4h+"]
-    sub["length_bucket"] = pd.cut(
-        sub["hours_played"], bins=bins, labels=labels, right=False
-    )
-
-    grouped = (
-        sub.groupby("length_bucket")["profit"]
-        .agg(count="count", mean_profit="mean", total_profit="sum")
-        .sort_index()
+    # observed=False keeps all four buckets, so empty ones are possible;
+    # the numba mean kernel divides by the group size, so derive the mean
+    # from the Cython aggregates instead of routing through group_mean
+    # (empty buckets come out NaN, same as the Cython mean).
+    gb = sub.groupby("length_bucket", observed=False)["profit"]
+    grouped = gb.agg(count="count", total_profit="sum")
+    grouped["mean_profit"] = grouped["total_profit"] / grouped["count"].where(
+        grouped["count"] > 0
     )
+    grouped = grouped.sort_index()
 
     buckets = {}
-    for bucket, row in grouped.iterrows():
-        label = str(bucket)
-        buckets[label] = {
+    for bucket, row in grouped.to_dict(orient="index").items():
+        buckets[str(bucket)] = {
             "count": int(row["count"]),
             "mean_profit": float(row["mean_profit"]),
             "total_profit": float(row["total_profit"]),
@@ -390,51 +583,60 @@ def api_export_csv():
     """
     Export all sessions as CSV (for pandas/Excel).
     """
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    writer.writerow(
-        [
-            "date",
-            "game",
-            "stake",
-            "format",
-            "location",
-            "buy_in",
-            "cash_out",
-            "profit",
-            "hours_played",
-            "hourly_rate",
-            "bullets",
-            "tag",
-            "notes",
-        ]
-    )
-
-    for s in bankroll.sessions:
-        writer.writerow(
+    bankroll = get_bankroll()
+
+    def generate():
+        # One small reusable buffer: rows are yielded straight to the
+        # socket instead of accumulating the whole file in memory.
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+
+        def flush_row(row):
+            writer.writerow(row)
+            value = buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+            return value
+
+        yield flush_row(
             [
-                s.date.isoformat() if s.date else "",
-                s.game or "",
-                getattr(s, "stake", "") or "",
-                getattr(s, "format", "") or "",
-                s.location or "",
-                s.buy_in,
-                s.cash_out,
-                s.profit,
-                s.hours_played if s.hours_played is not None else "",
-                s.hourly_rate if s.hourly_rate is not None else "",
-                getattr(s, "bullets", ""),
-                getattr(s, "tag", "") or "",
-                s.notes or "",
+                "date",
+                "game",
+                "stake",
+                "format",
+                "location",
+                "buy_in",
+                "cash_out",
+                "profit",
+                "hours_played",
+                "hourly_rate",
+                "bullets",
+                "tag",
+                "notes",
             ]
         )
 
-    csv_data = output.getvalue()
-    output.close()
+        for s in bankroll.sessions:
+            yield flush_row(
+                [
+                    s.date_iso or "",
+                    s.game or "",
+                    s.stake or "",
+                    s.format or "",
+                    s.location or "",
+                    s.buy_in,
+                    s.cash_out,
+                    s.profit,
+                    s.hours_played if s.hours_played is not None else "",
+                    s.hourly_rate if s.hourly_rate is not None else "",
+                    s.bullets,
+                    s.tag or "",
+                    s.notes or "",
+                ]
+            )
 
     return Response(
-        csv_data,
+        generate(),
         mimetype="text/csv",
         headers={
             "Content-Disposition": "attachment; filename=profitpulse_sessions.csv"
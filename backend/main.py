@@ -1,4 +1,7 @@
 from datetime import datetime, timedelta
+
+import numpy as np
+
 from .models import Bankroll, Session
 
 
@@ -26,38 +29,46 @@ def ask_for_int(prompt: str) -> int:
 
 # --- everything below here is your existing logic ---
 # seed_example_data, build_summary, build_history, etc.
+
+# Demo data, hoisted to module level so repeated seeding (tests, reseeds)
+# reuses one tuple instead of rebuilding the literal list per call.
+_SEED_BASE_DATE = datetime(2025, 1, 1)
+_SEED_SESSIONS = (
+    # game,           buy_in, cash_out, location, hours_played, bullets, format, tag,          notes
+    ("0.10/0.20 NLH", 20,     42,       "Online", 2.5,          1,       "cash", "A-game",     "Ran hot vs calling station"),
+    ("0.10/0.20 NLH", 20,     8,        "Online", 1.8,          2,       "cash", "spewy",      "Spewed in 3-bet pot"),
+    ("0.10/0.20 NLH", 20,     24,       "IRL",    2.0,          1,       "cash", "standard",   "Home game, small win"),
+    ("0.10/0.20 NLH", 20,     65,       "Online", 3.1,          1,       "cash", "locked-in",  "Hit a set multiway"),
+    ("0.10/0.20 NLH", 20,     0,        "IRL",    1.2,          2,       "cash", "tilt",       "Coolered set over set"),
+    ("0.10/0.20 NLH", 20,     30,       "Online", 1.5,          1,       "cash", "solid",      "Solid session, few big pots"),
+    ("0.10/0.20 NLH", 20,     18,       "Online", 1.0,          1,       "cash", "card-dead",  "Card dead but stayed even"),
+    ("0.10/0.20 NLH", 20,     55,       "IRL",    3.0,          1,       "cash", "good-table", "Good table, lots of limpers"),
+    ("0.10/0.20 NLH", 20,     10,       "Online", 1.4,          1,       "cash", "spewy",      "Bluffed off in bad spot"),
+    ("0.10/0.20 NLH", 20,     40,       "Online", 2.2,          1,       "cash", "solid",      "Played tight, got paid"),
+    ("0.25/0.50 NLH", 50,     120,      "IRL",    3.5,          1,       "cash", "A-game",     "Deep stack, big bluff got through"),
+    ("0.25/0.50 NLH", 50,     30,       "IRL",    2.0,          2,       "cash", "swingy",     "Lost a flip, clawed back a bit"),
+    ("0.25/0.50 NLH", 50,     95,       "Online", 2.8,          1,       "cash", "good-table", "Table full of recreationals"),
+    ("0.25/0.50 NLH", 50,     10,       "Online", 1.9,          1,       "cash", "hero-call",  "Bad hero call river"),
+    ("0.25/0.50 NLH", 50,     140,      "IRL",    4.0,          1,       "cash", "crushed",    "Crushed home game"),
+    ("0.10/0.20 PLO", 20,     50,       "Online", 1.7,          1,       "cash", "high-var",   "Wild game, lots of variance"),
+    ("0.10/0.20 PLO", 20,     5,        "Online", 1.3,          2,       "cash", "punished",   "Tried PLO, got punished"),
+    ("0.10/0.20 NLH", 20,     60,       "Online", 2.6,          1,       "cash", "focused",    "Good focus, few mistakes"),
+    ("0.10/0.20 NLH", 20,     16,       "IRL",    1.5,          1,       "cash", "short",      "Short session before class"),
+    ("0.10/0.20 NLH", 20,     70,       "Online", 3.2,          1,       "cash", "crushed",    "Crushed regs, ran well"),
+)
+
+# Precompute the per-row dates once as well (base date + i days).
+_SEED_DATES = tuple(
+    _SEED_BASE_DATE + timedelta(days=i) for i in range(len(_SEED_SESSIONS))
+)
+
+
 def seed_example_data() -> Bankroll:
     roll = Bankroll()
 
-    base_date = datetime(2025, 1, 1)
-
-    mock_sessions = [
-        # game,           buy_in, cash_out, location, hours_played, bullets, format, tag,          notes
-        ("0.10/0.20 NLH", 20,     42,       "Online", 2.5,          1,       "cash", "A-game",     "Ran hot vs calling station"),
-        ("0.10/0.20 NLH", 20,     8,        "Online", 1.8,          2,       "cash", "spewy",      "Spewed in 3-bet pot"),
-        ("0.10/0.20 NLH", 20,     24,       "IRL",    2.0,          1,       "cash", "standard",   "Home game, small win"),
-        ("0.10/0.20 NLH", 20,     65,       "Online", 3.1,          1,       "cash", "locked-in",  "Hit a set multiway"),
-        ("0.10/0.20 NLH", 20,     0,        "IRL",    1.2,          2,       "cash", "tilt",       "Coolered set over set"),
-        ("0.10/0.20 NLH", 20,     30,       "Online", 1.5,          1,       "cash", "solid",      "Solid session, few big pots"),
-        ("0.10/0.20 NLH", 20,     18,       "Online", 1.0,          1,       "cash", "card-dead",  "Card dead but stayed even"),
-        ("0.10/0.20 NLH", 20,     55,       "IRL",    3.0,          1,       "cash", "good-table", "Good table, lots of limpers"),
-        ("0.10/0.20 NLH", 20,     10,       "Online", 1.4,          1,       "cash", "spewy",      "Bluffed off in bad spot"),
-        ("0.10/0.20 NLH", 20,     40,       "Online", 2.2,          1,       "cash", "solid",      "Played tight, got paid"),
-        ("0.25/0.50 NLH", 50,     120,      "IRL",    3.5,          1,       "cash", "A-game",     "Deep stack, big bluff got through"),
-        ("0.25/0.50 NLH", 50,     30,       "IRL",    2.0,          2,       "cash", "swingy",     "Lost a flip, clawed back a bit"),
-        ("0.25/0.50 NLH", 50,     95,       "Online", 2.8,          1,       "cash", "good-table", "Table full of recreationals"),
-        ("0.25/0.50 NLH", 50,     10,       "Online", 1.9,          1,       "cash", "hero-call",  "Bad hero call river"),
-        ("0.25/0.50 NLH", 50,     140,      "IRL",    4.0,          1,       "cash", "crushed",    "Crushed home game"),
-        ("0.10/0.20 PLO", 20,     50,       "Online", 1.7,          1,       "cash", "high-var",   "Wild game, lots of variance"),
-        ("0.10/0.20 PLO", 20,     5,        "Online", 1.3,          2,       "cash", "punished",   "Tried PLO, got punished"),
-        ("0.10/0.20 NLH", 20,     60,       "Online", 2.6,          1,       "cash", "focused",    "Good focus, few mistakes"),
-        ("0.10/0.20 NLH", 20,     16,       "IRL",    1.5,          1,       "cash", "short",      "Short session before class"),
-        ("0.10/0.20 NLH", 20,     70,       "Online", 3.2,          1,       "cash", "crushed",    "Crushed regs, ran well"),
-    ]
-    for i, (game, buy_in, cash_out, location, hours, bullets, fmt, tag, notes) in enumerate(
-        mock_sessions
+    for session_date, (game, buy_in, cash_out, location, hours, bullets, fmt, tag, notes) in zip(
+        _SEED_DATES, _SEED_SESSIONS
     ):
-        session_date = base_date + timedelta(days=i)
         s = Session(
             game=game,
             buy_in=buy_in,
@@ -114,17 +125,26 @@ def print_detailed_report(roll: Bankroll) -> None:
     print()
 
     print("Sessions:")
-    for idx, s in enumerate(roll.sessions, start=1):
+    # Format all dates in one vectorized pass (strftime does a locale
+    # lookup per call), build the rows in a list, and print once.
+    date_strs = np.array(
+        [s.date for s in roll.sessions], dtype="datetime64[D]"
+    ).astype(str)
+
+    lines = []
+    for idx, (date_str, s) in enumerate(zip(date_strs, roll.sessions), start=1):
         hours_str = f"{s.hours_played:.2f}h" if s.hours_played else "n/a"
         hr = s.hourly_rate
         hr_str = f"{hr:+.2f}/h" if hr is not None else "n/a"
 
-        print(
-            f"{idx:2d}) {s.date.strftime('%Y-%m-%d')} | {s.game:18} | "
+        lines.append(
+            f"{idx:2d}) {date_str} | {s.game:18} | "
             f"Buy-in: {s.buy_in:6.2f} | Cash-out: {s.cash_out:6.2f} | "
             f"Profit: {s.profit:+6.2f} | Hours: {hours_str:7} | "
             f"Hourly: {hr_str:9} | {s.location} | {s.notes}"
         )
+    if lines:
+        print("\n".join(lines))
 
     print()
     bw = roll.biggest_win()
@@ -153,15 +173,16 @@ def print_bankroll_graph(roll: Bankroll) -> None:
         return
 
     print("\n=== Bankroll Over Time (ASCII graph) ===")
-    max_value = max(history)
-    min_value = min(history)
-    span = max_value - min_value if max_value != min_value else 1.0
-
-    for idx, value in enumerate(history, start=1):
+    # Normalize all bar lengths in one vectorized pass (np.ptp gives the
+    # span in a single sweep instead of separate max()/min() passes).
+    arr = np.asarray(history, dtype=np.float64)
+    min_value = arr.min()
+    span = np.ptp(arr) or 1.0
+    bar_lens = ((arr - min_value) / span * 40).astype(np.int64)
+
+    for idx, (value, bar_len) in enumerate(zip(history, bar_lens), start=1):
         # Scale bar length to 40 characters max
-        normalized = (value - min_value) / span
-        bar_len = int(normalized * 40)
-        bar = "#" * bar_len
+        bar = "#" * int(bar_len)
         print(f"Session {idx:2d}: {value:8.2f} | {bar}")
 
 
@@ -1,11 +1,77 @@
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Optional
 
+import numpy as np
 
-from datetime import datetime
+# C-implemented max/min key: no Python lambda frame per comparison.
+_PROFIT = attrgetter("profit")
+
+# Game strings repeat heavily across sessions, so stake inference is
+# memoized; partition extracts just the first token without building a
+# full split list.
+_STAKE_CACHE: dict[str, str] = {}
+
+
+def _infer_stake_from_game(game: str) -> str:
+    """
+    Try to guess the stake from the game string.
+    e.g. "0.10/0.20 NLH" -> "0.10/0.20"
+    """
+    stake = _STAKE_CACHE.get(game)
+    if stake is None:
+        head = game.partition(" ")[0]
+        stake = head if "/" in head else "unknown"
+        _STAKE_CACHE[game] = stake
+    return stake
+
+
+try:
+    # Optional: JIT-compiled prefix sum for bankroll_history.
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+
+    @njit(cache=True, fastmath=True)
+    def _history_kernel(start: float, profits: np.ndarray) -> np.ndarray:
+        """Running bankroll after each session (start + prefix sums)."""
+        out = np.empty_like(profits)
+        acc = start
+        for i in range(profits.shape[0]):
+            acc += profits[i]
+            out[i] = acc
+        return out
+
+    # Warm-compile at import; cache=True persists the compilation on disk.
+    _history_kernel(0.0, np.zeros(1, dtype=np.float64))
 
 
 class Session:
+    # Slots instead of a per-instance __dict__: attribute reads in the hot
+    # serialization/stats paths become C-level descriptor lookups, and each
+    # instance drops the dict overhead. __init__ assigns every slot, so
+    # callers never need getattr-with-default.
+    __slots__ = (
+        "game",
+        "buy_in",
+        "cash_out",
+        "location",
+        "hours_played",
+        "notes",
+        "_date_raw",
+        "_date_iso",
+        "stake",
+        "format",
+        "bullets",
+        "tag",
+        "profit",
+        "hourly_rate",
+    )
+
     def __init__(
         self,
         game: str,
@@ -14,7 +80,7 @@ class Session:
         location: str = "Unknown",
         hours_played: float | None = None,
         notes: str = "",
-        date: datetime | None = None,
+        date: datetime | str | None = None,
         *,
         stake: str | None = None,
         format: str = "cash",
@@ -35,107 +101,64 @@ class Session:
         self.location = location
         self.hours_played = hours_played
         self.notes = notes
-        self.date = date or datetime.now()
+        # ISO strings (from storage) are kept as-is and parsed lazily on
+        # first .date access — aggregate-only consumers never pay for it.
+        # The string form is also cached so saving an unchanged session
+        # skips the datetime -> string round-trip.
+        raw = date or datetime.now()
+        self._date_raw = raw
+        self._date_iso = raw if isinstance(raw, str) else None
 
         # NEW fields
-        self.stake = stake or self._infer_stake_from_game(game)
+        self.stake = stake or _infer_stake_from_game(game)
         self.format = format
-        self.bullets = int(bullets) if bullets is not None else 1
-        self.tag = tag or ""
-
-        # DO NOT assign self.profit or self.hourly_rate here;
-        # they are computed via @property methods below.
-
-    def _infer_stake_from_game(self, game: str) -> str:
-        """
-        Try to guess the stake from the game string.
-        e.g. "0.10/0.20 NLH" -> "0.10/0.20"
-        """
-        parts = game.split()
-        if parts and "/" in parts[0]:
-            return parts[0]
-        return "unknown"
-
-    @property
-    def profit(self) -> float:
-        """Net profit for the session."""
-        return self.cash_out - self.buy_in
-
-    @property
-    def hourly_rate(self) -> float | None:
-        """Profit per hour, if hours_played is known."""
-        if self.hours_played and self.hours_played > 0:
-            return self.profit / self.hours_played
-        return None
-
-    def __repr__(self) -> str:
-        return (
-            f"Session(game={self.game!r}, stake={self.stake!r}, "
-            f"buy_in={self.buy_in}, cash_out={self.cash_out}, "
-            f"location={self.location!r}, hours_played={self.hours_played}, "
-            f"bullets={self.bullets}, tag={self.tag!r}, "
-            f"profit={self.profit:+.2f})"
+        # Fast path: storage hands us ints already, so skip the int() call
+        # in the load hot loop and only coerce strays.
+        self.bullets = (
+            bullets
+            if isinstance(bullets, int)
+            else (1 if bullets is None else int(bullets))
         )
-        """
-        Represents a single poker session.
-
-        stake: e.g. "0.10/0.20", "0.25/0.50"
-        format: "cash", "tournament", etc.
-        bullets: how many buy-ins fired in this session
-        tag: short label like "A-game", "tired", "tilt", etc.
-        """
-        self.game = game
-        self.buy_in = float(buy_in)
-        self.cash_out = float(cash_out)
-        self.location = location
-        self.hours_played = hours_played
-        self.notes = notes
-        self.date = date or datetime.now()
-
-        # NEW fields (with sensible defaults)
-        self.stake = stake or self._infer_stake_from_game(game)
-        self.format = format
-        self.bullets = int(bullets) if bullets is not None else 1
         self.tag = tag or ""
 
-        # Derived fields
+        # Derived fields, computed once: buy_in/cash_out are fixed at
+        # construction, so plain slot reads beat property calls in the
+        # aggregate loops. Callers that mutate the inputs (the PUT
+        # endpoint) recompute these themselves.
         self.profit = self.cash_out - self.buy_in
         self.hourly_rate = (
             self.profit / hours_played if hours_played and hours_played > 0 else None
         )
 
-    def _infer_stake_from_game(self, game: str) -> str:
-        """
-        Try to guess the stake from the game string.
-        e.g. "0.10/0.20 NLH" -> "0.10/0.20"
-        """
-        parts = game.split()
-        if parts:
-            # if first token looks like "0.10/0.20"
-            if "/" in parts[0]:
-                return parts[0]
-        return "unknown"
-
     @property
-    def profit(self) -> float:
-        """Cash-out minus buy-in for this session."""
-        return self.cash_out - self.buy_in
+    def date(self) -> datetime:
+        """Session datetime; ISO strings are parsed (once) on first access."""
+        value = self._date_raw
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+            self._date_raw = value
+        return value
+
+    @date.setter
+    def date(self, value: datetime | str | None) -> None:
+        self._date_raw = value
+        self._date_iso = value if isinstance(value, str) else None
 
     @property
-    def hourly_rate(self) -> Optional[float]:
-        """
-        Profit per hour for this session, if hours_played is known.
-        Returns None if we don't have hours.
-        """
-        if self.hours_played is None or self.hours_played <= 0:
-            return None
-        return self.profit / self.hours_played
+    def date_iso(self) -> Optional[str]:
+        """ISO-8601 date string, reusing the loaded form when unchanged."""
+        if self._date_iso is None:
+            d = self.date
+            self._date_iso = d.isoformat() if d else None
+        return self._date_iso
 
     def __repr__(self) -> str:
         return (
-            f"Session(game={self.game!r}, buy_in={self.buy_in}, "
-            f"cash_out={self.cash_out}, location={self.location!r}, "
-            f"date={self.date!r}, hours_played={self.hours_played})"
+            f"Session(game={self.game!r}, stake={self.stake!r}, "
+            f"buy_in={self.buy_in}, cash_out={self.cash_out}, "
+            f"location={self.location!r}, hours_played={self.hours_played}, "
+            f"bullets={self.bullets}, tag={self.tag!r}, "
+            f"profit={self.profit:+.2f})"
         )
 
 
@@ -149,14 +172,126 @@ class Bankroll:
             raise ValueError("starting_amount must be non-negative")
         self.starting_amount = float(starting_amount)
         self.sessions: List[Session] = []
+        # Set whenever sessions change; consumers that cache derived views
+        # (e.g. the API's DataFrame) check it and clear it on refresh.
+        self._df_dirty = True
+        # Lazily-built SoA numeric columns over self.sessions (one NumPy
+        # array per field). self.sessions stays the source of truth; the
+        # columns are rebuilt on demand after mutations.
+        self._cols_dirty = True
+        self._buy_in_arr = np.empty(0, dtype=np.float64)
+        self._cash_out_arr = np.empty(0, dtype=np.float64)
+        self._profit_arr = np.empty(0, dtype=np.float64)
+        self._hours_arr = np.empty(0, dtype=np.float64)
+        self._hourly_arr = np.empty(0, dtype=np.float64)
+        self._bullets_arr = np.empty(0, dtype=np.float64)
+        # Scalar aggregates, refreshed together with the columns so
+        # summary()'s repeated total_profit() calls are O(1) reads.
+        self._profit_sum = 0.0
+        self._wins = 0
+        # Sorted date index for range queries, maintained separately from
+        # the numeric columns so building it doesn't force lazy date
+        # parsing on aggregate-only consumers.
+        self._dates_dirty = True
+        self._dates_sorted = np.empty(0, dtype="datetime64[s]")
+        self._date_order = np.empty(0, dtype=np.int64)
 
     def add_session(self, session: Session) -> None:
         """Add a session to the bankroll history."""
         self.sessions.append(session)
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """Flag cached session views as stale (call after any mutation)."""
+        self._df_dirty = True
+        self._cols_dirty = True
+        self._dates_dirty = True
+
+    def _refresh_columns(self) -> None:
+        """One AoS->SoA gather pass, then vectorized derived columns."""
+        n = len(self.sessions)
+        buy_in = np.empty(n, dtype=np.float64)
+        cash_out = np.empty(n, dtype=np.float64)
+        hours = np.empty(n, dtype=np.float64)
+        bullets = np.empty(n, dtype=np.float64)
+
+        for i, s in enumerate(self.sessions):
+            buy_in[i] = s.buy_in
+            cash_out[i] = s.cash_out
+            hours[i] = s.hours_played if s.hours_played is not None else np.nan
+            bullets[i] = s.bullets if s.bullets is not None else 1
+
+        profit = cash_out - buy_in
+        hourly = np.divide(
+            profit, hours, out=np.full(n, np.nan), where=hours > 0
+        )
+
+        self._buy_in_arr = buy_in
+        self._cash_out_arr = cash_out
+        self._profit_arr = profit
+        self._hours_arr = hours
+        self._hourly_arr = hourly
+        self._bullets_arr = bullets
+        self._profit_sum = float(profit.sum())
+        self._wins = int((profit > 0).sum())
+        self._cols_dirty = False
+
+    def numeric_columns(self) -> dict:
+        """
+        Parallel NumPy columns over all sessions (missing hours/hourly are
+        NaN). The arrays are cached; callers must not mutate them.
+        """
+        if self._cols_dirty:
+            self._refresh_columns()
+        return {
+            "buy_in": self._buy_in_arr,
+            "cash_out": self._cash_out_arr,
+            "profit": self._profit_arr,
+            "hours_played": self._hours_arr,
+            "hourly_rate": self._hourly_arr,
+            "bullets": self._bullets_arr,
+        }
+
+    def _refresh_dates(self) -> None:
+        """Rebuild the sorted datetime64 index (stable sort over dates)."""
+        dates = np.array(
+            [s.date for s in self.sessions], dtype="datetime64[s]"
+        )
+        order = np.argsort(dates, kind="stable")
+        self._dates_sorted = dates[order]
+        self._date_order = order
+        self._dates_dirty = False
+
+    def profit_between(self, start: datetime, end: datetime) -> float:
+        """
+        Total profit over sessions with start <= date < end.
+
+        Uses searchsorted on a lazily-maintained sorted date index, so a
+        range query is O(log N) endpoints plus an O(k) slice instead of a
+        full scan.
+        """
+        if not self.sessions:
+            return 0.0
+        if self._dates_dirty:
+            self._refresh_dates()
+        lo, hi = np.searchsorted(
+            self._dates_sorted, np.array([start, end], dtype="datetime64[s]")
+        )
+        if lo == hi:
+            return 0.0
+        return float(self._profits()[self._date_order[lo:hi]].sum())
+
+    def _profits(self) -> np.ndarray:
+        """The cached profit column, refreshed if sessions changed."""
+        if self._cols_dirty:
+            self._refresh_columns()
+        return self._profit_arr
 
     def total_profit(self) -> float:
-        """Sum of profits across all sessions."""
-        return sum(s.profit for s in self.sessions)
+        """Sum of profits across all sessions (cached, O(1) when clean)."""
+        if self._cols_dirty:
+            self._refresh_columns()
+        return self._profit_sum
 
     def current_bankroll(self) -> float:
         """Starting amount + total profit."""
@@ -164,11 +299,12 @@ class Bankroll:
 
     def total_hours(self) -> float:
         """Sum of hours_played for sessions that have it."""
-        return sum(
-            s.hours_played
-            for s in self.sessions
-            if s.hours_played is not None and s.hours_played > 0
-        )
+        if self._cols_dirty:
+            self._refresh_columns()
+        hours = self._hours_arr
+        # NaN marks missing hours and fails the > 0 comparison, so the
+        # mask drops it along with zero/negative entries.
+        return float(hours[hours > 0].sum())
 
     def hourly_rate(self) -> Optional[float]:
         """
@@ -187,32 +323,31 @@ class Bankroll:
         """
         if not self.sessions:
             return None
-        wins = sum(1 for s in self.sessions if s.profit > 0)
-        return (wins / len(self.sessions)) * 100.0
+        if self._cols_dirty:
+            self._refresh_columns()
+        return (self._wins / len(self.sessions)) * 100.0
 
     def biggest_win(self) -> Optional[Session]:
         """Session with the highest profit (or None if no sessions)."""
         if not self.sessions:
             return None
-        return max(self.sessions, key=lambda s: s.profit)
+        return max(self.sessions, key=_PROFIT)
 
     def biggest_loss(self) -> Optional[Session]:
         """Session with the lowest profit (or None if no sessions)."""
         if not self.sessions:
             return None
-        return min(self.sessions, key=lambda s: s.profit)
+        return min(self.sessions, key=_PROFIT)
 
     def bankroll_history(self) -> List[float]:
         """
         Returns a list of bankroll values after each session,
         in chronological order.
         """
-        history: List[float] = []
-        current = self.starting_amount
-        for s in self.sessions:
-            current += s.profit
-            history.append(current)
-        return history
+        profits = self._profits()
+        if _HAS_NUMBA:
+            return _history_kernel(self.starting_amount, profits).tolist()
+        return (self.starting_amount + np.cumsum(profits)).tolist()
 
     def summary(self) -> str:
         """Multi-line text summary of key stats."""
@@ -223,20 +358,17 @@ class Bankroll:
         hr = self.hourly_rate()
         wr = self.winrate()
 
-        lines = [
-            f"Sessions: {num}",
-            f"Total profit: {total:+.2f}",
-            f"Current bankroll: {current:.2f}",
-        ]
-
-        if hours > 0:
-            lines.append(f"Total hours (recorded): {hours:.2f}")
-        if hr is not None:
-            lines.append(f"Overall hourly rate: {hr:+.2f} per hour")
-        if wr is not None:
-            lines.append(f"Winrate: {wr:.1f}% of sessions winning")
-
-        return "\n".join(lines)
+        # Single string assembly (one BUILD_STRING plus three conditional
+        # concats) instead of list appends and a join — this runs on every
+        # UI stats refresh.
+        return (
+            f"Sessions: {num}\n"
+            f"Total profit: {total:+.2f}\n"
+            f"Current bankroll: {current:.2f}"
+            + (f"\nTotal hours (recorded): {hours:.2f}" if hours > 0 else "")
+            + (f"\nOverall hourly rate: {hr:+.2f} per hour" if hr is not None else "")
+            + (f"\nWinrate: {wr:.1f}% of sessions winning" if wr is not None else "")
+        )
 
     def __repr__(self) -> str:
         return (